@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
 from .coordinator import RenovasjonCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.CALENDAR, Platform.BINARY_SENSOR]
 
 SERVICE_REFRESH = "refresh"
@@ -26,6 +31,42 @@ SERVICE_REFRESH_SCHEMA = vol.Schema(
 )
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Renovasjonsportal integration."""
+    hass.data.setdefault(DOMAIN, {})
+
+    async def async_refresh_service(call: ServiceCall) -> None:
+        """Handle the refresh service call."""
+        entry_id = call.data.get("entry_id")
+
+        if entry_id:
+            # Refresh specific entry
+            if entry_id not in hass.data[DOMAIN]:
+                raise ServiceValidationError(
+                    f"Unknown entry_id: {entry_id}",
+                    translation_domain=DOMAIN,
+                    translation_key="unknown_entry_id",
+                    translation_placeholders={"entry_id": entry_id},
+                )
+            coordinator = hass.data[DOMAIN][entry_id]
+            await coordinator.async_refresh()
+            _LOGGER.debug("Refreshed data for entry %s", entry_id)
+        else:
+            # Refresh all entries concurrently
+            await asyncio.gather(*(coord.async_refresh() for coord in hass.data[DOMAIN].values()))
+            _LOGGER.debug("Refreshed data for all entries")
+
+    # Register services once for the integration, independent of config entries
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        async_refresh_service,
+        schema=SERVICE_REFRESH_SCHEMA,
+    )
+
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Renovasjonsportal from a config entry."""
     _LOGGER.debug("Setting up Renovasjon integration for %s", entry.title)
@@ -37,44 +78,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    @callback
+    def async_remove_coordinator() -> None:
+        """Drop the coordinator once the entry has been unloaded."""
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+
+    # Home Assistant runs this only after a successful unload (or a failed setup)
+    entry.async_on_unload(async_remove_coordinator)
+
     # Listen for options updates
     entry.async_on_unload(entry.add_update_listener(async_options_updated))
 
+    # Roll "today" over at midnight, independent of the polling interval
+    entry.async_on_unload(
+        async_track_time_change(hass, coordinator.async_handle_midnight, hour=0, minute=0, second=0)
+    )
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services (only once)
-    if not hass.services.has_service(DOMAIN, SERVICE_REFRESH):
-
-        async def async_refresh_service(call: ServiceCall) -> None:
-            """Handle the refresh service call."""
-            entry_id = call.data.get("entry_id")
-
-            if entry_id:
-                # Refresh specific entry
-                if entry_id not in hass.data[DOMAIN]:
-                    raise ServiceValidationError(
-                        f"Unknown entry_id: {entry_id}",
-                        translation_domain=DOMAIN,
-                        translation_key="unknown_entry_id",
-                        translation_placeholders={"entry_id": entry_id},
-                    )
-                coordinator = hass.data[DOMAIN][entry_id]
-                await coordinator.async_refresh()
-                _LOGGER.debug("Refreshed data for entry %s", entry_id)
-            else:
-                # Refresh all entries
-                for coord in hass.data[DOMAIN].values():
-                    await coord.async_refresh()
-                _LOGGER.debug("Refreshed data for all entries")
-
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_REFRESH,
-            async_refresh_service,
-            schema=SERVICE_REFRESH_SCHEMA,
-        )
-
     return True
 
 
@@ -89,14 +111,5 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Renovasjon integration for %s", entry.title)
 
-    # Unload platforms
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-        # Unregister services if no more entries
-        if not hass.data[DOMAIN]:
-            hass.services.async_remove(DOMAIN, SERVICE_REFRESH)
-
-    return unload_ok
+    # Coordinator cleanup is registered via entry.async_on_unload in async_setup_entry
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date as date_type
 from datetime import datetime
 from typing import Any
 from urllib.parse import quote
@@ -57,6 +58,11 @@ class WasteDisposal:
     fraction: str
     description: str | None
     symbol_id: int
+    date_only: date_type = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the date part of the disposal datetime."""
+        self.date_only = self.date.date()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> WasteDisposal:
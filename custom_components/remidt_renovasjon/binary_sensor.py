@@ -7,13 +7,11 @@ import logging
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, WASTE_FRACTIONS
-from .coordinator import RenovasjonCoordinator
+from .const import DOMAIN
+from .coordinator import RenovasjonCoordinator, get_fraction_meta
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +46,7 @@ class RenovasjonCollectionTodaySensor(CoordinatorEntity[RenovasjonCoordinator],
     """Binary sensor that indicates if there is a collection today for a waste fraction."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
 
     def __init__(
         self,
@@ -58,11 +57,10 @@ class RenovasjonCollectionTodaySensor(CoordinatorEntity[RenovasjonCoordinator],
         super().__init__(coordinator)
 
         self._fraction = fraction
+        self._last_state: tuple[bool, bool | None] | None = None
 
-        # Get fraction config if available
-        fraction_config = WASTE_FRACTIONS.get(fraction, {})
-        translation_key = fraction_config.get("translation_key", fraction.lower().replace(" ", "_"))
-        self._icon = fraction_config.get("icon", "mdi:calendar-check")
+        translation_key, icon = get_fraction_meta(fraction)
+        self._icon = icon or "mdi:calendar-check"
 
         # Entity attributes
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{fraction}_today"
@@ -71,14 +69,7 @@ class RenovasjonCollectionTodaySensor(CoordinatorEntity[RenovasjonCoordinator],
         # Fallback name
         self._attr_name = f"{fraction} today"
 
-        # Device info - group all entities under one device per address
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
-            name=f"Renovasjon {coordinator.data.address_name}",
-            manufacturer="Renovasjonsportal",
-            model=coordinator.data.municipality,
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def icon(self) -> str:
@@ -93,10 +84,7 @@ class RenovasjonCollectionTodaySensor(CoordinatorEntity[RenovasjonCoordinator],
         if self.coordinator.data is None:
             return None
 
-        # Check if any disposal for this fraction is scheduled for today
-        disposals = self.coordinator.data.disposals_by_fraction.get(self._fraction, [])
-        today = dt_util.now().date()
-        return any(d.date.date() == today for d in disposals)
+        return self._fraction in self.coordinator.data.fractions_collecting_today
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
@@ -106,4 +94,10 @@ class RenovasjonCollectionTodaySensor(CoordinatorEntity[RenovasjonCoordinator],
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # Only write state when availability or today's status actually changed
+        state = (self.available, self.is_on)
+        if state == self._last_state:
+            return
+
+        self._last_state = state
         self.async_write_ha_state()
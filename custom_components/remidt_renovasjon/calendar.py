@@ -3,23 +3,20 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import date, datetime, timedelta
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CALENDAR_LOOKAHEAD_DAYS,
-    CONF_ADDRESS_NAME,
-    CONF_MUNICIPALITY,
     DOMAIN,
-    WASTE_FRACTIONS,
 )
-from .coordinator import RenovasjonCoordinator
+from .coordinator import RenovasjonCoordinator, RenovasjonData, get_fraction_meta
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +39,7 @@ class RenovasjonCalendar(CoordinatorEntity[RenovasjonCoordinator], CalendarEntit
     """Calendar entity for waste collection events."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
 
     def __init__(self, coordinator: RenovasjonCoordinator) -> None:
         """Initialize the calendar entity."""
@@ -49,14 +47,11 @@ class RenovasjonCalendar(CoordinatorEntity[RenovasjonCoordinator], CalendarEntit
 
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_calendar"
         self._attr_name = "Renovasjon"
+        self._last_state: tuple[bool, CalendarEvent | None] | None = None
+        self._cached_next_event: tuple[date, CalendarEvent | None] | None = None
+        self._cached_events: tuple[RenovasjonData, list[CalendarEvent]] | None = None
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
-            name=f"Renovasjon {coordinator.config_entry.data[CONF_ADDRESS_NAME]}",
-            manufacturer="Renovasjonsportal",
-            model=coordinator.config_entry.data[CONF_MUNICIPALITY],
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def event(self) -> CalendarEvent | None:
@@ -64,15 +59,11 @@ class RenovasjonCalendar(CoordinatorEntity[RenovasjonCoordinator], CalendarEntit
         if self.coordinator.data is None:
             return None
 
-        events = self._get_events_for_range(
-            date.today(),
-            date.today() + timedelta(days=CALENDAR_LOOKAHEAD_DAYS),
-        )
+        today = self.coordinator.data.today
+        if self._cached_next_event is None or self._cached_next_event[0] != today:
+            self._cached_next_event = (today, self._get_next_event(today))
 
-        if not events:
-            return None
-
-        return events[0]
+        return self._cached_next_event[1]
 
     async def async_get_events(
         self,
@@ -83,6 +74,44 @@ class RenovasjonCalendar(CoordinatorEntity[RenovasjonCoordinator], CalendarEntit
         """Return calendar events within a datetime range."""
         return self._get_events_for_range(start_date.date(), end_date.date())
 
+    def _get_next_event(self, today: date) -> CalendarEvent | None:
+        """Get the first waste collection event on or after today."""
+        data = self.coordinator.data
+        index = bisect_left(data.disposal_dates, today)
+        if index == len(data.disposal_dates):
+            return None
+
+        if data.disposal_dates[index] > today + timedelta(days=CALENDAR_LOOKAHEAD_DAYS):
+            return None
+
+        return self._get_all_events(data)[index]
+
+    def _get_all_events(self, data: RenovasjonData) -> list[CalendarEvent]:
+        """Get events for all disposals, built once per coordinator refresh."""
+        if self._cached_events is not None and self._cached_events[0] is data:
+            return self._cached_events[1]
+
+        # Hoist loop invariants out of the per-event work
+        uid_prefix = f"{self._attr_unique_id}_"
+        one_day = timedelta(days=1)
+        events: list[CalendarEvent] = []
+
+        for event_date, fraction, disposal in data.sorted_disposals:
+            translation_key, _ = get_fraction_meta(fraction)
+
+            events.append(
+                CalendarEvent(
+                    start=event_date,
+                    end=event_date + one_day,
+                    summary=fraction,
+                    description=disposal.description,
+                    uid=uid_prefix + translation_key + "_" + event_date.isoformat(),
+                )
+            )
+
+        self._cached_events = (data, events)
+        return events
+
     def _get_events_for_range(
         self,
         start: date,
@@ -92,32 +121,23 @@ class RenovasjonCalendar(CoordinatorEntity[RenovasjonCoordinator], CalendarEntit
         if self.coordinator.data is None:
             return []
 
-        events: list[CalendarEvent] = []
+        data = self.coordinator.data
 
-        for fraction, disposals in self.coordinator.data.disposals_by_fraction.items():
-            fraction_config = WASTE_FRACTIONS.get(fraction, {})
-            translation_key = fraction_config.get(
-                "translation_key", fraction.lower().replace(" ", "_")
-            )
+        # Events are parallel to the date-sorted disposal index, so the window is a slice
+        lo = bisect_left(data.disposal_dates, start)
+        hi = bisect_right(data.disposal_dates, end)
 
-            for disposal in disposals:
-                event_date = disposal.date.date()
-
-                if start <= event_date <= end:
-                    events.append(
-                        CalendarEvent(
-                            start=event_date,
-                            end=event_date + timedelta(days=1),
-                            summary=fraction,
-                            description=disposal.description,
-                            uid=f"{self._attr_unique_id}_{translation_key}_{event_date.isoformat()}",
-                        )
-                    )
-
-        events.sort(key=lambda e: e.start)
-        return events
+        return self._get_all_events(data)[lo:hi]
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._cached_next_event = None
+
+        # Only write state when availability or the next event actually changed
+        state = (self.available, self.event)
+        if state == self._last_state:
+            return
+
+        self._last_state = state
         self.async_write_ha_state()
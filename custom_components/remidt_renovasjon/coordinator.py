@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import logging
 from datetime import date, datetime, timedelta
+from functools import cache
+from operator import itemgetter
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
     RenovasjonApiClient,
@@ -23,11 +27,25 @@ from .const import (
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL_HOURS,
     DOMAIN,
+    WASTE_FRACTIONS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@cache
+def get_fraction_meta(fraction: str) -> tuple[str, str | None]:
+    """Get translation key and icon for a waste fraction.
+
+    Unknown fractions get a translation key derived from their name and no icon.
+    """
+    fraction_config = WASTE_FRACTIONS.get(fraction, {})
+    return (
+        fraction_config.get("translation_key", fraction.lower().replace(" ", "_")),
+        fraction_config.get("icon"),
+    )
+
+
 class RenovasjonData:
     """Container for Renovasjon data."""
 
@@ -45,6 +63,56 @@ class RenovasjonData:
         self.disposals_by_fraction = disposals_by_fraction
         self.last_update = datetime.now()
 
+        # Flat index of all disposals ordered by date, for bisecting date ranges.
+        # Each fraction's list is already sorted, so this is a stable merge of sorted runs.
+        self.sorted_disposals: list[tuple[date, str, WasteDisposal]] = sorted(
+            (
+                (disposal.date_only, fraction, disposal)
+                for fraction, disposals in disposals_by_fraction.items()
+                for disposal in disposals
+            ),
+            key=itemgetter(0),
+        )
+        self.disposal_dates: list[date] = [item[0] for item in self.sorted_disposals]
+
+        # Collection days per fraction, for O(1) date membership checks
+        self.collection_dates_by_fraction: dict[str, frozenset[date]] = {
+            fraction: frozenset(d.date_only for d in disposals)
+            for fraction, disposals in disposals_by_fraction.items()
+        }
+
+        # Bumped per fraction only when its schedule differs from the previous refresh
+        self.fraction_version: dict[str, int] = dict.fromkeys(disposals_by_fraction, 0)
+
+        # Resolved per refresh and at midnight, so readers never hit the clock
+        self.today: date = date.min
+        self.fractions_collecting_today: frozenset[str] = frozenset()
+        self.update_today(dt_util.now().date())
+
+    def update_today(self, today: date) -> None:
+        """Resolve collections for the given day.
+
+        Called once per refresh and again at midnight so entities can answer in O(1).
+        """
+        self.today = today
+        self.fractions_collecting_today = frozenset(
+            fraction
+            for fraction, collection_dates in self.collection_dates_by_fraction.items()
+            if today in collection_dates
+        )
+
+    def carry_over_versions(self, previous: RenovasjonData) -> None:
+        """Continue fraction versions from the previous refresh."""
+        for fraction, disposals in self.disposals_by_fraction.items():
+            version = previous.fraction_version.get(fraction)
+            if version is None:
+                continue
+
+            if previous.disposals_by_fraction[fraction] == disposals:
+                self.fraction_version[fraction] = version
+            else:
+                self.fraction_version[fraction] = version + 1
+
     @property
     def fractions(self) -> list[str]:
         """Get list of all waste fractions."""
@@ -53,11 +121,10 @@ class RenovasjonData:
     def get_next_disposal(self, fraction: str) -> WasteDisposal | None:
         """Get next disposal for a fraction."""
         disposals = self.disposals_by_fraction.get(fraction, [])
-        now = datetime.now()
 
         for disposal in disposals:
             # Compare dates only (ignore time component)
-            if disposal.date.date() >= now.date():
+            if disposal.date_only >= self.today:
                 return disposal
 
         return None
@@ -65,9 +132,8 @@ class RenovasjonData:
     def get_upcoming_disposals(self, fraction: str, limit: int = 5) -> list[WasteDisposal]:
         """Get upcoming disposals for a fraction."""
         disposals = self.disposals_by_fraction.get(fraction, [])
-        now = datetime.now()
 
-        upcoming = [d for d in disposals if d.date.date() >= now.date()]
+        upcoming = [d for d in disposals if d.date_only >= self.today]
         return upcoming[:limit]
 
     def get_days_until(self, fraction: str) -> int | None:
@@ -76,8 +142,7 @@ class RenovasjonData:
         if next_disposal is None:
             return None
 
-        today = date.today()
-        delta = next_disposal.date.date() - today
+        delta = next_disposal.date_only - self.today
         return delta.days
 
 
@@ -102,6 +167,15 @@ class RenovasjonCoordinator(DataUpdateCoordinator[RenovasjonData]):
         self._address_name: str = entry.data[CONF_ADDRESS_NAME]
         self._municipality: str = entry.data[CONF_MUNICIPALITY]
 
+        # Shared by all entities - group them under one device per address
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"Renovasjon {self._address_name}",
+            manufacturer="Renovasjonsportal",
+            model=self._municipality,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
     def update_interval_from_options(self) -> None:
         """Update the polling interval from options."""
         update_interval_hours = self.config_entry.options.get(
@@ -110,6 +184,15 @@ class RenovasjonCoordinator(DataUpdateCoordinator[RenovasjonData]):
         self.update_interval = timedelta(hours=update_interval_hours)
         _LOGGER.debug("Update interval set to %d hours", update_interval_hours)
 
+    @callback
+    def async_handle_midnight(self, now: datetime) -> None:
+        """Roll date-dependent state over to the new day without refetching."""
+        if self.data is None:
+            return
+
+        self.data.update_today(now.date())
+        self.async_update_listeners()
+
     async def _async_update_data(self) -> RenovasjonData:
         """Fetch data from API."""
         session = async_get_clientsession(self.hass)
@@ -124,13 +207,18 @@ class RenovasjonCoordinator(DataUpdateCoordinator[RenovasjonData]):
                 len(disposals_by_fraction),
             )
 
-            return RenovasjonData(
+            data = RenovasjonData(
                 address_id=self._address_id,
                 address_name=self._address_name,
                 municipality=self._municipality,
                 disposals_by_fraction=disposals_by_fraction,
             )
 
+            if self.data is not None:
+                data.carry_over_versions(self.data)
+
+            return data
+
         except RenovasjonConnectionError as err:
             raise UpdateFailed(f"Connection error: {err}") from err
         except RenovasjonApiError as err:
@@ -12,7 +12,6 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -24,9 +23,8 @@ from .const import (
     ATTR_NEXT_DATE,
     ATTR_UPCOMING_DATES,
     DOMAIN,
-    WASTE_FRACTIONS,
 )
-from .coordinator import RenovasjonCoordinator, RenovasjonData
+from .coordinator import RenovasjonCoordinator, RenovasjonData, get_fraction_meta
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,28 +70,19 @@ class RenovasjonSensor(CoordinatorEntity[RenovasjonCoordinator], SensorEntity):
         super().__init__(coordinator)
 
         self._fraction = fraction
+        self._last_state: tuple[bool, int | None, date | None] | None = None
 
-        # Get fraction config if available
-        fraction_config = WASTE_FRACTIONS.get(fraction, {})
+        translation_key, icon = get_fraction_meta(fraction)
 
         # Entity attributes
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{fraction}"
-        self._attr_translation_key = fraction_config.get(
-            "translation_key", fraction.lower().replace(" ", "_")
-        )
-        self._attr_icon = fraction_config.get("icon", "mdi:trash-can-outline")
+        self._attr_translation_key = translation_key
+        self._attr_icon = icon or "mdi:trash-can-outline"
 
         # Use fraction name as fallback
         self._attr_name = fraction
 
-        # Device info - group all sensors under one device per address
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
-            name=f"Renovasjon {coordinator.data.address_name}",
-            manufacturer="Renovasjonsportal",
-            model=coordinator.data.municipality,
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> date | None:
@@ -105,7 +94,7 @@ class RenovasjonSensor(CoordinatorEntity[RenovasjonCoordinator], SensorEntity):
         if next_disposal is None:
             return None
 
-        return next_disposal.date.date()
+        return next_disposal.date_only
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -136,11 +125,22 @@ class RenovasjonSensor(CoordinatorEntity[RenovasjonCoordinator], SensorEntity):
         # Upcoming dates
         upcoming = data.get_upcoming_disposals(self._fraction, limit=5)
         if upcoming:
-            attrs[ATTR_UPCOMING_DATES] = [d.date.date().isoformat() for d in upcoming]
+            attrs[ATTR_UPCOMING_DATES] = [d.date_only.isoformat() for d in upcoming]
 
         return attrs
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # State only depends on this fraction's schedule and the current day
+        data = self.coordinator.data
+        if data is None:
+            state = (self.available, None, None)
+        else:
+            state = (self.available, data.fraction_version.get(self._fraction), data.today)
+
+        if state == self._last_state:
+            return
+
+        self._last_state = state
         self.async_write_ha_state()
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
 
 import pytest
+import time_machine
+from homeassistant.util import dt as dt_util
 
 from ..const import CONF_ADDRESS_ID, CONF_ADDRESS_NAME, CONF_MUNICIPALITY
 
@@ -93,6 +97,10 @@ MOCK_CONFIG_ENTRY_DATA = {
     CONF_MUNICIPALITY: "Kristiansund kommune",
 }
 
+# Wall clock and time zone for every test, see the frozen_time fixture
+TEST_TIME_ZONE = ZoneInfo("Europe/Oslo")
+FROZEN_TIME = datetime(2026, 1, 4, 12, 0, tzinfo=TEST_TIME_ZONE)
+
 
 @pytest.fixture
 def mock_address_search_response() -> dict:
@@ -112,6 +120,20 @@ def mock_config_entry_data() -> dict:
     return MOCK_CONFIG_ENTRY_DATA.copy()
 
 
+@pytest.fixture(autouse=True, scope="module")
+def frozen_time() -> Generator[None, None, None]:
+    """Freeze the clock and time zone so fixtures and assertions agree on the current day.
+
+    Traveling to a ZoneInfo-aware instant also switches the process local time zone, so
+    naive datetime.now() in the tests and dt_util.now() in the integration see the same day.
+    """
+    original_time_zone = dt_util.DEFAULT_TIME_ZONE
+    dt_util.set_default_time_zone(TEST_TIME_ZONE)
+    with time_machine.travel(FROZEN_TIME, tick=False):
+        yield
+    dt_util.set_default_time_zone(original_time_zone)
+
+
 @pytest.fixture
 def mock_aiohttp_session() -> Generator[MagicMock, None, None]:
     """Create a mock aiohttp session."""
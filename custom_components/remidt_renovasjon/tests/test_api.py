@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import date
 from unittest.mock import MagicMock
 
 import pytest
@@ -72,6 +73,7 @@ class TestWasteDisposal:
         assert result.fraction == "Restavfall"
         assert result.description == "Test description"
         assert result.symbol_id == 15
+        assert result.date_only == date(2026, 1, 5)
 
     def test_from_dict_with_timezone(self):
         """Test creating WasteDisposal from dict with timezone."""
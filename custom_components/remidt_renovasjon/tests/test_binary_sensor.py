@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from ..api import WasteDisposal
 from ..binary_sensor import RenovasjonCollectionTodaySensor, async_setup_entry
@@ -20,23 +20,22 @@ class TestRenovasjonCollectionTodaySensor:
     """Tests for RenovasjonCollectionTodaySensor."""
 
     @pytest.fixture
-    def mock_hass(self) -> MagicMock:
-        """Create a mock HomeAssistant instance."""
-        hass = MagicMock(spec=HomeAssistant)
-        hass.data = {}
-        return hass
+    def mock_hass(self) -> SimpleNamespace:
+        """Create a stub HomeAssistant instance."""
+        return SimpleNamespace(data={})
 
     @pytest.fixture
-    def mock_entry(self) -> MagicMock:
-        """Create a mock ConfigEntry."""
-        entry = MagicMock(spec=ConfigEntry)
-        entry.entry_id = "test_entry_id"
-        entry.data = MOCK_CONFIG_ENTRY_DATA.copy()
-        entry.options = {}
-        return entry
+    def mock_entry(self) -> SimpleNamespace:
+        """Create a stub ConfigEntry."""
+        return SimpleNamespace(
+            entry_id="test_entry_id",
+            data=MOCK_CONFIG_ENTRY_DATA.copy(),
+            options={},
+        )
 
-    @pytest.fixture
-    def sample_data_with_today(self) -> RenovasjonData:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_data_with_today(cls) -> RenovasjonData:
         """Create sample RenovasjonData with a disposal today."""
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         tomorrow = today + timedelta(days=1)
@@ -71,11 +70,13 @@ class TestRenovasjonCollectionTodaySensor:
             },
         )
 
-    @pytest.fixture
-    def sample_data_without_today(self) -> RenovasjonData:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_data_without_today(cls) -> RenovasjonData:
         """Create sample RenovasjonData without a disposal today."""
-        tomorrow = datetime.now() + timedelta(days=1)
-        next_week = datetime.now() + timedelta(days=7)
+        now = datetime.now()
+        tomorrow = now + timedelta(days=1)
+        next_week = now + timedelta(days=7)
 
         return RenovasjonData(
             address_id="test-uuid",
@@ -101,24 +102,34 @@ class TestRenovasjonCollectionTodaySensor:
 
     @pytest.fixture
     def mock_coordinator_with_today(
-        self, mock_hass: MagicMock, mock_entry: MagicMock, sample_data_with_today: RenovasjonData
+        self,
+        mock_hass: SimpleNamespace,
+        mock_entry: SimpleNamespace,
+        sample_data_with_today: RenovasjonData,
     ) -> MagicMock:
         """Create a mock coordinator with disposal today."""
         coordinator = MagicMock(spec=RenovasjonCoordinator)
         coordinator.hass = mock_hass
         coordinator.config_entry = mock_entry
+        coordinator.device_info = DeviceInfo(identifiers={(DOMAIN, mock_entry.entry_id)})
         coordinator.data = sample_data_with_today
+        coordinator.last_update_success = True
         return coordinator
 
     @pytest.fixture
     def mock_coordinator_without_today(
-        self, mock_hass: MagicMock, mock_entry: MagicMock, sample_data_without_today: RenovasjonData
+        self,
+        mock_hass: SimpleNamespace,
+        mock_entry: SimpleNamespace,
+        sample_data_without_today: RenovasjonData,
     ) -> MagicMock:
         """Create a mock coordinator without disposal today."""
         coordinator = MagicMock(spec=RenovasjonCoordinator)
         coordinator.hass = mock_hass
         coordinator.config_entry = mock_entry
+        coordinator.device_info = DeviceInfo(identifiers={(DOMAIN, mock_entry.entry_id)})
         coordinator.data = sample_data_without_today
+        coordinator.last_update_success = True
         return coordinator
 
     def test_sensor_init(self, mock_coordinator_with_today: MagicMock):
@@ -129,6 +140,7 @@ class TestRenovasjonCollectionTodaySensor:
         )
 
         assert sensor._attr_has_entity_name is True
+        assert sensor.should_poll is False
         assert sensor._attr_unique_id == "test_entry_id_Restavfall_today"
         assert sensor._fraction == "Restavfall"
 
@@ -204,43 +216,54 @@ class TestRenovasjonCollectionTodaySensor:
         assert attrs["fraction"] == "Restavfall"
 
     def test_sensor_device_info(self, mock_coordinator_with_today: MagicMock):
-        """Test sensor device info."""
+        """Test sensor shares the coordinator's device info."""
         sensor = RenovasjonCollectionTodaySensor(
             coordinator=mock_coordinator_with_today,
             fraction="Restavfall",
         )
 
-        device_info = sensor._attr_device_info
+        assert sensor._attr_device_info is mock_coordinator_with_today.device_info
 
-        assert device_info is not None
-        assert ("remidt_renovasjon", "test_entry_id") in device_info["identifiers"]
-        assert "Renovasjon Test Street 1" in device_info["name"]
-        assert device_info["manufacturer"] == "Renovasjonsportal"
-        assert device_info["model"] == "Test Municipality"
+    def test_coordinator_update_skips_unchanged_state(
+        self, mock_coordinator_with_today: MagicMock, sample_data_without_today: RenovasjonData
+    ):
+        """Test state is only written when today's collection status changes."""
+        sensor = RenovasjonCollectionTodaySensor(
+            coordinator=mock_coordinator_with_today,
+            fraction="Restavfall",
+        )
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 1
+
+        # Collection moved away from today
+        mock_coordinator_with_today.data = sample_data_without_today
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 2
 
 
 class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
     @pytest.fixture
-    def mock_hass(self) -> MagicMock:
-        """Create a mock HomeAssistant instance."""
-        hass = MagicMock(spec=HomeAssistant)
-        hass.data = {DOMAIN: {}}
-        return hass
+    def mock_hass(self) -> SimpleNamespace:
+        """Create a stub HomeAssistant instance."""
+        return SimpleNamespace(data={DOMAIN: {}})
 
     @pytest.fixture
-    def mock_entry(self) -> MagicMock:
-        """Create a mock ConfigEntry."""
-        entry = MagicMock(spec=ConfigEntry)
-        entry.entry_id = "test_entry_id"
-        entry.data = MOCK_CONFIG_ENTRY_DATA.copy()
-        entry.options = {}
-        return entry
+    def mock_entry(self) -> SimpleNamespace:
+        """Create a stub ConfigEntry."""
+        return SimpleNamespace(
+            entry_id="test_entry_id",
+            data=MOCK_CONFIG_ENTRY_DATA.copy(),
+            options={},
+        )
 
     @pytest.mark.asyncio
     async def test_async_setup_entry_creates_sensors(
-        self, mock_hass: MagicMock, mock_entry: MagicMock
+        self, mock_hass: SimpleNamespace, mock_entry: SimpleNamespace
     ):
         """Test that async_setup_entry creates binary sensor entities."""
         sample_data = RenovasjonData(
@@ -256,6 +279,7 @@ class TestAsyncSetupEntry:
         mock_coordinator = MagicMock(spec=RenovasjonCoordinator)
         mock_coordinator.data = sample_data
         mock_coordinator.config_entry = mock_entry
+        mock_coordinator.device_info = DeviceInfo(identifiers={(DOMAIN, mock_entry.entry_id)})
         mock_coordinator.async_config_entry_first_refresh = AsyncMock()
 
         mock_hass.data[DOMAIN][mock_entry.entry_id] = mock_coordinator
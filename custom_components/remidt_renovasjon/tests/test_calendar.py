@@ -3,21 +3,22 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
+from itertools import pairwise
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.components.calendar import CalendarEvent
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from ..api import WasteDisposal
 from ..calendar import RenovasjonCalendar
 from ..const import DOMAIN
 from ..coordinator import RenovasjonCoordinator, RenovasjonData
-from .conftest import MOCK_CONFIG_ENTRY_DATA
+from .conftest import FROZEN_TIME, MOCK_CONFIG_ENTRY_DATA
 
 # Fixed test dates for deterministic tests
-TEST_TODAY = date(2026, 1, 4)
+TEST_TODAY = FROZEN_TIME.date()
 TEST_TOMORROW = datetime(2026, 1, 5)
 TEST_NEXT_WEEK = datetime(2026, 1, 11)
 TEST_TWO_WEEKS = datetime(2026, 1, 18)
@@ -27,22 +28,21 @@ class TestRenovasjonCalendar:
     """Tests for RenovasjonCalendar."""
 
     @pytest.fixture
-    def mock_hass(self) -> MagicMock:
-        """Create a mock HomeAssistant instance."""
-        hass = MagicMock(spec=HomeAssistant)
-        hass.data = {}
-        return hass
+    def mock_hass(self) -> SimpleNamespace:
+        """Create a stub HomeAssistant instance."""
+        return SimpleNamespace(data={})
 
     @pytest.fixture
-    def mock_entry(self) -> MagicMock:
-        """Create a mock ConfigEntry."""
-        entry = MagicMock(spec=ConfigEntry)
-        entry.entry_id = "test_entry_id"
-        entry.data = MOCK_CONFIG_ENTRY_DATA.copy()
-        return entry
+    def mock_entry(self) -> SimpleNamespace:
+        """Create a stub ConfigEntry."""
+        return SimpleNamespace(
+            entry_id="test_entry_id",
+            data=MOCK_CONFIG_ENTRY_DATA.copy(),
+        )
 
-    @pytest.fixture
-    def sample_data(self) -> RenovasjonData:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_data(cls) -> RenovasjonData:
         """Create sample RenovasjonData with fixed dates."""
         return RenovasjonData(
             address_id="test-uuid",
@@ -51,23 +51,12 @@ class TestRenovasjonCalendar:
             disposals_by_fraction={
                 "Restavfall": [
                     WasteDisposal(
-                        date=TEST_TOMORROW,
-                        fraction="Restavfall",
-                        description=None,
-                        symbol_id=15,
-                    ),
-                    WasteDisposal(
-                        date=TEST_NEXT_WEEK,
+                        date=disposal_date,
                         fraction="Restavfall",
                         description=None,
                         symbol_id=15,
-                    ),
-                    WasteDisposal(
-                        date=TEST_TWO_WEEKS,
-                        fraction="Restavfall",
-                        description=None,
-                        symbol_id=15,
-                    ),
+                    )
+                    for disposal_date in (TEST_TOMORROW, TEST_NEXT_WEEK, TEST_TWO_WEEKS)
                 ],
                 "Matavfall": [
                     WasteDisposal(
@@ -82,13 +71,15 @@ class TestRenovasjonCalendar:
 
     @pytest.fixture
     def mock_coordinator(
-        self, mock_hass: MagicMock, mock_entry: MagicMock, sample_data: RenovasjonData
+        self, mock_hass: SimpleNamespace, mock_entry: SimpleNamespace, sample_data: RenovasjonData
     ) -> MagicMock:
         """Create a mock coordinator."""
         coordinator = MagicMock(spec=RenovasjonCoordinator)
         coordinator.hass = mock_hass
         coordinator.config_entry = mock_entry
+        coordinator.device_info = DeviceInfo(identifiers={(DOMAIN, mock_entry.entry_id)})
         coordinator.data = sample_data
+        coordinator.last_update_success = True
         return coordinator
 
     @pytest.fixture
@@ -100,20 +91,15 @@ class TestRenovasjonCalendar:
         """Test calendar initialization."""
         assert calendar._attr_has_entity_name is True
         assert calendar._attr_name == "Renovasjon"
+        assert calendar.should_poll is False
 
     def test_calendar_unique_id(self, calendar: RenovasjonCalendar):
         """Test calendar unique ID."""
         assert calendar._attr_unique_id == "test_entry_id_calendar"
 
-    def test_calendar_device_info(self, calendar: RenovasjonCalendar):
-        """Test calendar device info."""
-        device_info = calendar._attr_device_info
-
-        assert device_info is not None
-        assert ("remidt_renovasjon", "test_entry_id") in device_info["identifiers"]
-        assert "Renovasjon Sigden 6" in device_info["name"]
-        assert device_info["manufacturer"] == "Renovasjonsportal"
-        assert device_info["model"] == "Kristiansund kommune"
+    def test_calendar_device_info(self, calendar: RenovasjonCalendar, mock_coordinator: MagicMock):
+        """Test calendar shares the coordinator's device info."""
+        assert calendar._attr_device_info is mock_coordinator.device_info
 
     def test_calendar_event_returns_next_event(self, calendar: RenovasjonCalendar):
         """Test that event property returns the next upcoming event."""
@@ -125,6 +111,18 @@ class TestRenovasjonCalendar:
         assert isinstance(first_event, CalendarEvent)
         assert first_event.start == TEST_TOMORROW.date()
 
+    def test_get_next_event_matches_range_query(self, calendar: RenovasjonCalendar):
+        """Test that the next-event fast path agrees with the full range query."""
+        events = calendar._get_events_for_range(TEST_TODAY, TEST_TODAY + timedelta(days=365))
+
+        next_event = calendar._get_next_event(TEST_TODAY)
+
+        assert next_event == events[0]
+
+    def test_get_next_event_none_upcoming(self, calendar: RenovasjonCalendar):
+        """Test that no event is returned when all disposals are in the past."""
+        assert calendar._get_next_event(TEST_TWO_WEEKS.date() + timedelta(days=1)) is None
+
     def test_calendar_event_no_data(
         self, mock_coordinator: MagicMock, calendar: RenovasjonCalendar
     ):
@@ -136,7 +134,7 @@ class TestRenovasjonCalendar:
         assert event is None
 
     @pytest.mark.asyncio
-    async def test_async_get_events(self, mock_hass: MagicMock, calendar: RenovasjonCalendar):
+    async def test_async_get_events(self, mock_hass: SimpleNamespace, calendar: RenovasjonCalendar):
         """Test async_get_events returns events within range."""
         start = datetime(2026, 1, 4)
         end = datetime(2026, 2, 4)
@@ -147,7 +145,7 @@ class TestRenovasjonCalendar:
 
     @pytest.mark.asyncio
     async def test_async_get_events_filtered_by_date(
-        self, mock_hass: MagicMock, calendar: RenovasjonCalendar
+        self, mock_hass: SimpleNamespace, calendar: RenovasjonCalendar
     ):
         """Test async_get_events filters by date range."""
         # Only get events in the next 3 days
@@ -161,7 +159,7 @@ class TestRenovasjonCalendar:
 
     @pytest.mark.asyncio
     async def test_async_get_events_no_data(
-        self, mock_hass: MagicMock, mock_coordinator: MagicMock, calendar: RenovasjonCalendar
+        self, mock_hass: SimpleNamespace, mock_coordinator: MagicMock, calendar: RenovasjonCalendar
     ):
         """Test async_get_events when no data available."""
         mock_coordinator.data = None
@@ -189,6 +187,34 @@ class TestRenovasjonCalendar:
             assert event.end == event.start + timedelta(days=1)
             assert event.uid is not None
 
+    def test_event_uid(self, calendar: RenovasjonCalendar):
+        """Test that event UIDs combine calendar ID, fraction and date."""
+        events = calendar._get_events_for_range(TEST_TODAY, TEST_TOMORROW.date())
+
+        uids = {e.uid for e in events}
+        assert uids == {
+            "test_entry_id_calendar_restavfall_2026-01-05",
+            "test_entry_id_calendar_matavfall_2026-01-05",
+        }
+
+    def test_events_reused_until_data_changes(
+        self, mock_coordinator: MagicMock, calendar: RenovasjonCalendar, sample_data: RenovasjonData
+    ):
+        """Test that events are built once per coordinator data object."""
+        first = calendar._get_events_for_range(TEST_TODAY, TEST_TWO_WEEKS.date())
+        second = calendar._get_events_for_range(TEST_TODAY, TEST_TWO_WEEKS.date())
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+        mock_coordinator.data = RenovasjonData(
+            address_id=sample_data.address_id,
+            address_name=sample_data.address_name,
+            municipality=sample_data.municipality,
+            disposals_by_fraction=sample_data.disposals_by_fraction,
+        )
+        third = calendar._get_events_for_range(TEST_TODAY, TEST_TWO_WEEKS.date())
+        assert third == first
+        assert third[0] is not first[0]
+
     def test_event_with_description(self, calendar: RenovasjonCalendar):
         """Test that event description is included."""
         events = calendar._get_events_for_range(
@@ -207,31 +233,42 @@ class TestRenovasjonCalendar:
             date(2026, 2, 4),
         )
 
-        dates = [e.start for e in events]
-        assert dates == sorted(dates)
+        assert all(a.start <= b.start for a, b in pairwise(events))
+
+    def test_coordinator_update_skips_unchanged_state(
+        self, mock_coordinator: MagicMock, calendar: RenovasjonCalendar
+    ):
+        """Test state is only written when the next event or availability changes."""
+        calendar.async_write_ha_state = MagicMock()
+
+        calendar._handle_coordinator_update()
+        calendar._handle_coordinator_update()
+        assert calendar.async_write_ha_state.call_count == 1
+
+        mock_coordinator.last_update_success = False
+        calendar._handle_coordinator_update()
+        assert calendar.async_write_ha_state.call_count == 2
 
 
 class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
     @pytest.fixture
-    def mock_hass(self) -> MagicMock:
-        """Create a mock HomeAssistant instance."""
-        hass = MagicMock(spec=HomeAssistant)
-        hass.data = {DOMAIN: {}}
-        return hass
+    def mock_hass(self) -> SimpleNamespace:
+        """Create a stub HomeAssistant instance."""
+        return SimpleNamespace(data={DOMAIN: {}})
 
     @pytest.fixture
-    def mock_entry(self) -> MagicMock:
-        """Create a mock ConfigEntry."""
-        entry = MagicMock(spec=ConfigEntry)
-        entry.entry_id = "test_entry_id"
-        entry.data = MOCK_CONFIG_ENTRY_DATA.copy()
-        return entry
+    def mock_entry(self) -> SimpleNamespace:
+        """Create a stub ConfigEntry."""
+        return SimpleNamespace(
+            entry_id="test_entry_id",
+            data=MOCK_CONFIG_ENTRY_DATA.copy(),
+        )
 
     @pytest.mark.asyncio
     async def test_async_setup_entry_creates_calendar(
-        self, mock_hass: MagicMock, mock_entry: MagicMock
+        self, mock_hass: SimpleNamespace, mock_entry: SimpleNamespace
     ):
         """Test that async_setup_entry creates a calendar entity."""
         from ..calendar import async_setup_entry
@@ -249,6 +286,7 @@ class TestAsyncSetupEntry:
         mock_coordinator = MagicMock(spec=RenovasjonCoordinator)
         mock_coordinator.data = sample_data
         mock_coordinator.config_entry = mock_entry
+        mock_coordinator.device_info = DeviceInfo(identifiers={(DOMAIN, mock_entry.entry_id)})
         mock_coordinator.async_config_entry_first_refresh = AsyncMock()
 
         mock_hass.data[DOMAIN][mock_entry.entry_id] = mock_coordinator
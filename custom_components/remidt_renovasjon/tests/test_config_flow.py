@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,6 +24,25 @@ from ..const import (
 )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def mock_client_class() -> Generator[MagicMock, None, None]:
+    """Patch the API client and HTTP session once for the whole module."""
+    with (
+        patch("remidt_renovasjon.config_flow.async_get_clientsession"),
+        patch("remidt_renovasjon.config_flow.RenovasjonApiClient") as mock_client_class,
+    ):
+        yield mock_client_class
+
+
+@pytest.fixture
+def mock_client(mock_client_class: MagicMock) -> AsyncMock:
+    """Create a fresh API client mock returned by the patched client class."""
+    mock_client_class.reset_mock()
+    mock_client = AsyncMock()
+    mock_client_class.return_value = mock_client
+    return mock_client
+
+
 class TestRenovasjonConfigFlow:
     """Tests for RenovasjonConfigFlow."""
 
@@ -50,7 +70,9 @@ class TestRenovasjonConfigFlow:
         assert "address" in result["data_schema"].schema
 
     @pytest.mark.asyncio
-    async def test_step_user_search_success(self, flow: RenovasjonConfigFlow):
+    async def test_step_user_search_success(
+        self, flow: RenovasjonConfigFlow, mock_client: AsyncMock
+    ):
         """Test successful address search proceeds to selection."""
         mock_addresses = [
             AddressSearchResult(
@@ -60,69 +82,49 @@ class TestRenovasjonConfigFlow:
             )
         ]
 
-        with (
-            patch("remidt_renovasjon.config_flow.async_get_clientsession"),
-            patch("remidt_renovasjon.config_flow.RenovasjonApiClient") as mock_client_class,
-        ):
-            mock_client = AsyncMock()
-            mock_client.search_address.return_value = mock_addresses
-            mock_client_class.return_value = mock_client
+        mock_client.search_address.return_value = mock_addresses
 
-            result = await flow.async_step_user({"address": "Test Street"})
+        result = await flow.async_step_user({"address": "Test Street"})
 
-            assert result["type"] == FlowResultType.FORM
-            assert result["step_id"] == "select"
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "select"
 
     @pytest.mark.asyncio
-    async def test_step_user_no_addresses_found(self, flow: RenovasjonConfigFlow):
+    async def test_step_user_no_addresses_found(
+        self, flow: RenovasjonConfigFlow, mock_client: AsyncMock
+    ):
         """Test address search with no results shows error."""
-        with (
-            patch("remidt_renovasjon.config_flow.async_get_clientsession"),
-            patch("remidt_renovasjon.config_flow.RenovasjonApiClient") as mock_client_class,
-        ):
-            mock_client = AsyncMock()
-            mock_client.search_address.return_value = []
-            mock_client_class.return_value = mock_client
+        mock_client.search_address.return_value = []
 
-            result = await flow.async_step_user({"address": "Nonexistent"})
+        result = await flow.async_step_user({"address": "Nonexistent"})
 
-            assert result["type"] == FlowResultType.FORM
-            assert result["step_id"] == "user"
-            assert result["errors"]["address"] == "no_addresses_found"
-
-    @pytest.mark.asyncio
-    async def test_step_user_connection_error(self, flow: RenovasjonConfigFlow):
-        """Test address search with connection error."""
-        with (
-            patch("remidt_renovasjon.config_flow.async_get_clientsession"),
-            patch("remidt_renovasjon.config_flow.RenovasjonApiClient") as mock_client_class,
-        ):
-            mock_client = AsyncMock()
-            mock_client.search_address.side_effect = RenovasjonConnectionError("Connection failed")
-            mock_client_class.return_value = mock_client
-
-            result = await flow.async_step_user({"address": "Test"})
-
-            assert result["type"] == FlowResultType.FORM
-            assert result["step_id"] == "user"
-            assert result["errors"]["base"] == "cannot_connect"
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "user"
+        assert result["errors"]["address"] == "no_addresses_found"
 
     @pytest.mark.asyncio
-    async def test_step_user_api_error(self, flow: RenovasjonConfigFlow):
-        """Test address search with API error."""
-        with (
-            patch("remidt_renovasjon.config_flow.async_get_clientsession"),
-            patch("remidt_renovasjon.config_flow.RenovasjonApiClient") as mock_client_class,
-        ):
-            mock_client = AsyncMock()
-            mock_client.search_address.side_effect = RenovasjonApiError("API error")
-            mock_client_class.return_value = mock_client
+    @pytest.mark.parametrize(
+        ("exception", "expected_error"),
+        [
+            (RenovasjonConnectionError("Connection failed"), "cannot_connect"),
+            (RenovasjonApiError("API error"), "unknown"),
+        ],
+    )
+    async def test_step_user_search_error(
+        self,
+        flow: RenovasjonConfigFlow,
+        mock_client: AsyncMock,
+        exception: Exception,
+        expected_error: str,
+    ):
+        """Test address search errors are shown on the user step."""
+        mock_client.search_address.side_effect = exception
 
-            result = await flow.async_step_user({"address": "Test"})
+        result = await flow.async_step_user({"address": "Test"})
 
-            assert result["type"] == FlowResultType.FORM
-            assert result["step_id"] == "user"
-            assert result["errors"]["base"] == "unknown"
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "user"
+        assert result["errors"]["base"] == expected_error
 
     @pytest.mark.asyncio
     async def test_step_select_shows_form(self, flow: RenovasjonConfigFlow):
@@ -146,7 +148,9 @@ class TestRenovasjonConfigFlow:
         assert result["step_id"] == "select"
 
     @pytest.mark.asyncio
-    async def test_step_select_creates_entry(self, flow: RenovasjonConfigFlow):
+    async def test_step_select_creates_entry(
+        self, flow: RenovasjonConfigFlow, mock_client: AsyncMock
+    ):
         """Test selecting an address creates a config entry."""
         flow._addresses = [
             AddressSearchResult(
@@ -157,14 +161,10 @@ class TestRenovasjonConfigFlow:
         ]
 
         with (
-            patch("remidt_renovasjon.config_flow.async_get_clientsession"),
-            patch("remidt_renovasjon.config_flow.RenovasjonApiClient") as mock_client_class,
             patch.object(flow, "async_set_unique_id", new_callable=AsyncMock),
             patch.object(flow, "_abort_if_unique_id_configured"),
         ):
-            mock_client = AsyncMock()
             mock_client.get_disposals.return_value = []
-            mock_client_class.return_value = mock_client
 
             result = await flow.async_step_select({"address_id": "test-uuid"})
 
@@ -192,7 +192,9 @@ class TestRenovasjonConfigFlow:
         assert result["errors"]["base"] == "invalid_address"
 
     @pytest.mark.asyncio
-    async def test_step_select_connection_error(self, flow: RenovasjonConfigFlow):
+    async def test_step_select_connection_error(
+        self, flow: RenovasjonConfigFlow, mock_client: AsyncMock
+    ):
         """Test validation with connection error."""
         flow._addresses = [
             AddressSearchResult(
@@ -203,14 +205,10 @@ class TestRenovasjonConfigFlow:
         ]
 
         with (
-            patch("remidt_renovasjon.config_flow.async_get_clientsession"),
-            patch("remidt_renovasjon.config_flow.RenovasjonApiClient") as mock_client_class,
             patch.object(flow, "async_set_unique_id", new_callable=AsyncMock),
             patch.object(flow, "_abort_if_unique_id_configured"),
         ):
-            mock_client = AsyncMock()
             mock_client.get_disposals.side_effect = RenovasjonConnectionError("Connection failed")
-            mock_client_class.return_value = mock_client
 
             result = await flow.async_step_select({"address_id": "test-uuid"})
 
@@ -318,7 +316,9 @@ class TestReconfigureFlow:
         assert result["step_id"] == "reconfigure"
 
     @pytest.mark.asyncio
-    async def test_reconfigure_search_success(self, flow: RenovasjonConfigFlow):
+    async def test_reconfigure_search_success(
+        self, flow: RenovasjonConfigFlow, mock_client: AsyncMock
+    ):
         """Test successful address search in reconfigure proceeds to selection."""
         mock_addresses = [
             AddressSearchResult(
@@ -328,32 +328,22 @@ class TestReconfigureFlow:
             )
         ]
 
-        with (
-            patch("remidt_renovasjon.config_flow.async_get_clientsession"),
-            patch("remidt_renovasjon.config_flow.RenovasjonApiClient") as mock_client_class,
-        ):
-            mock_client = AsyncMock()
-            mock_client.search_address.return_value = mock_addresses
-            mock_client_class.return_value = mock_client
+        mock_client.search_address.return_value = mock_addresses
 
-            result = await flow.async_step_reconfigure({"address": "New Street"})
+        result = await flow.async_step_reconfigure({"address": "New Street"})
 
-            assert result["type"] == FlowResultType.FORM
-            assert result["step_id"] == "reconfigure_select"
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "reconfigure_select"
 
     @pytest.mark.asyncio
-    async def test_reconfigure_no_addresses_found(self, flow: RenovasjonConfigFlow):
+    async def test_reconfigure_no_addresses_found(
+        self, flow: RenovasjonConfigFlow, mock_client: AsyncMock
+    ):
         """Test reconfigure with no addresses found shows error."""
-        with (
-            patch("remidt_renovasjon.config_flow.async_get_clientsession"),
-            patch("remidt_renovasjon.config_flow.RenovasjonApiClient") as mock_client_class,
-        ):
-            mock_client = AsyncMock()
-            mock_client.search_address.return_value = []
-            mock_client_class.return_value = mock_client
+        mock_client.search_address.return_value = []
 
-            result = await flow.async_step_reconfigure({"address": "Nonexistent"})
+        result = await flow.async_step_reconfigure({"address": "Nonexistent"})
 
-            assert result["type"] == FlowResultType.FORM
-            assert result["step_id"] == "reconfigure"
-            assert result["errors"]["address"] == "no_addresses_found"
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "reconfigure"
+        assert result["errors"]["address"] == "no_addresses_found"
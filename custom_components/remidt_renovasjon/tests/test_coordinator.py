@@ -12,7 +12,7 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from ..api import RenovasjonApiError, RenovasjonConnectionError, WasteDisposal
 from ..const import CONF_ADDRESS_ID, CONF_ADDRESS_NAME, CONF_MUNICIPALITY
-from ..coordinator import RenovasjonCoordinator, RenovasjonData
+from ..coordinator import RenovasjonCoordinator, RenovasjonData, get_fraction_meta
 from .conftest import MOCK_CONFIG_ENTRY_DATA
 
 
@@ -105,6 +105,97 @@ class TestRenovasjonData:
         days = data.get_days_until("Papir")
         assert days is None
 
+    def test_helpers_follow_resolved_today(self, data: RenovasjonData):
+        """Test that the schedule helpers use the day resolved on the data."""
+        data.update_today(date.today() + timedelta(days=2))
+
+        next_disposal = data.get_next_disposal("Restavfall")
+        assert next_disposal is not None
+        assert next_disposal.date_only == date.today() + timedelta(days=7)
+        assert data.get_days_until("Restavfall") == 5
+        assert data.get_upcoming_disposals("Matavfall") == []
+
+    def test_sorted_disposals(self, data: RenovasjonData):
+        """Test that all disposals are flattened into a date-ordered index."""
+        assert len(data.sorted_disposals) == 4
+        assert data.disposal_dates == sorted(data.disposal_dates)
+        assert data.disposal_dates == [item[0] for item in data.sorted_disposals]
+
+        # Past Matavfall disposal comes first
+        event_date, fraction, disposal = data.sorted_disposals[0]
+        assert fraction == "Matavfall"
+        assert event_date == disposal.date.date()
+
+        # Same-day disposals keep the fraction order
+        tomorrow = date.today() + timedelta(days=1)
+        same_day = [fraction for day, fraction, _ in data.sorted_disposals if day == tomorrow]
+        assert same_day == ["Restavfall", "Matavfall"]
+
+    def test_collection_dates_by_fraction(self, data: RenovasjonData):
+        """Test that collection days are indexed per fraction."""
+        tomorrow = date.today() + timedelta(days=1)
+
+        assert tomorrow in data.collection_dates_by_fraction["Restavfall"]
+        assert tomorrow in data.collection_dates_by_fraction["Matavfall"]
+        assert len(data.collection_dates_by_fraction["Matavfall"]) == 2
+        assert data.collection_dates_by_fraction["Papir"] == frozenset()
+
+    def test_fractions_collecting_today(self, sample_disposals: dict):
+        """Test that today's collections are resolved when the data is built."""
+        sample_disposals["Papir"] = [
+            WasteDisposal(date=datetime.now(), fraction="Papir", description=None, symbol_id=0),
+        ]
+
+        data = RenovasjonData(
+            address_id="test-uuid",
+            address_name="Test Street 1",
+            municipality="Test Municipality",
+            disposals_by_fraction=sample_disposals,
+        )
+
+        assert data.fractions_collecting_today == frozenset({"Papir"})
+
+    def test_carry_over_versions(self, data: RenovasjonData, sample_disposals: dict):
+        """Test that only fractions with a changed schedule get a new version."""
+        changed = dict(sample_disposals)
+        changed["Restavfall"] = sample_disposals["Restavfall"][:1]
+        changed["Glass"] = []
+
+        new_data = RenovasjonData(
+            address_id="test-uuid",
+            address_name="Test Street 1",
+            municipality="Test Municipality",
+            disposals_by_fraction=changed,
+        )
+        new_data.carry_over_versions(data)
+
+        assert new_data.fraction_version == {
+            "Restavfall": 1,
+            "Matavfall": 0,
+            "Papir": 0,
+            "Glass": 0,
+        }
+
+    def test_update_today(self, data: RenovasjonData):
+        """Test that today's collections can be rolled over to another day."""
+        assert data.fractions_collecting_today == frozenset()
+
+        data.update_today(date.today() + timedelta(days=1))
+
+        assert data.fractions_collecting_today == frozenset({"Restavfall", "Matavfall"})
+
+
+class TestGetFractionMeta:
+    """Tests for get_fraction_meta."""
+
+    def test_known_fraction(self):
+        """Test metadata for a fraction defined in WASTE_FRACTIONS."""
+        assert get_fraction_meta("Glass og metallemballasje") == ("glass_metall", "mdi:bottle-wine")
+
+    def test_unknown_fraction(self):
+        """Test fallback metadata for an unknown fraction."""
+        assert get_fraction_meta("Farlig Avfall") == ("farlig_avfall", None)
+
 
 class TestRenovasjonCoordinator:
     """Tests for RenovasjonCoordinator."""
@@ -136,6 +227,45 @@ class TestRenovasjonCoordinator:
         assert coordinator._address_name == MOCK_CONFIG_ENTRY_DATA[CONF_ADDRESS_NAME]
         assert coordinator._municipality == MOCK_CONFIG_ENTRY_DATA[CONF_MUNICIPALITY]
 
+    def test_device_info(self, coordinator: RenovasjonCoordinator):
+        """Test the device info shared by all entities of the entry."""
+        device_info = coordinator.device_info
+
+        assert ("remidt_renovasjon", "test_entry_id") in device_info["identifiers"]
+        assert device_info["name"] == "Renovasjon Sigden 6"
+        assert device_info["manufacturer"] == "Renovasjonsportal"
+        assert device_info["model"] == "Kristiansund kommune"
+
+    def test_async_handle_midnight(self, coordinator: RenovasjonCoordinator):
+        """Test that midnight rolls today's collections over and notifies listeners."""
+        tomorrow = datetime.now() + timedelta(days=1)
+        coordinator.data = RenovasjonData(
+            address_id="test-uuid",
+            address_name="Test Street 1",
+            municipality="Test Municipality",
+            disposals_by_fraction={
+                "Restavfall": [
+                    WasteDisposal(
+                        date=tomorrow, fraction="Restavfall", description=None, symbol_id=0
+                    )
+                ],
+            },
+        )
+        coordinator.async_update_listeners = MagicMock()
+
+        coordinator.async_handle_midnight(tomorrow)
+
+        assert coordinator.data.fractions_collecting_today == frozenset({"Restavfall"})
+        coordinator.async_update_listeners.assert_called_once()
+
+    def test_async_handle_midnight_no_data(self, coordinator: RenovasjonCoordinator):
+        """Test that midnight is a no-op before the first refresh."""
+        coordinator.async_update_listeners = MagicMock()
+
+        coordinator.async_handle_midnight(datetime.now())
+
+        coordinator.async_update_listeners.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_async_update_data_success(
         self, coordinator: RenovasjonCoordinator, mock_hass: MagicMock
@@ -167,6 +297,45 @@ class TestRenovasjonCoordinator:
             assert data.address_name == MOCK_CONFIG_ENTRY_DATA[CONF_ADDRESS_NAME]
             assert "Restavfall" in data.fractions
 
+    @pytest.mark.asyncio
+    async def test_async_update_data_versions(self, coordinator: RenovasjonCoordinator):
+        """Test that fraction versions carry over between refreshes."""
+        tomorrow = datetime.now() + timedelta(days=1)
+        first = {
+            "Restavfall": [
+                WasteDisposal(date=tomorrow, fraction="Restavfall", description=None, symbol_id=0)
+            ],
+        }
+        second = {
+            "Restavfall": [
+                WasteDisposal(
+                    date=tomorrow + timedelta(days=1),
+                    fraction="Restavfall",
+                    description=None,
+                    symbol_id=0,
+                )
+            ],
+        }
+
+        with (
+            patch("remidt_renovasjon.coordinator.async_get_clientsession"),
+            patch("remidt_renovasjon.coordinator.RenovasjonApiClient") as mock_client_class,
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_client.get_disposals_by_fraction.return_value = first
+            coordinator.data = await coordinator._async_update_data()
+            assert coordinator.data.fraction_version == {"Restavfall": 0}
+
+            # Unchanged schedule keeps its version
+            coordinator.data = await coordinator._async_update_data()
+            assert coordinator.data.fraction_version == {"Restavfall": 0}
+
+            mock_client.get_disposals_by_fraction.return_value = second
+            coordinator.data = await coordinator._async_update_data()
+            assert coordinator.data.fraction_version == {"Restavfall": 1}
+
     @pytest.mark.asyncio
     async def test_async_update_data_connection_error(
         self, coordinator: RenovasjonCoordinator, mock_hass: MagicMock
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
 
 from ..api import WasteDisposal
 from ..const import DOMAIN
@@ -20,26 +19,25 @@ class TestDiagnostics:
     """Tests for diagnostics."""
 
     @pytest.fixture
-    def mock_hass(self) -> MagicMock:
-        """Create a mock HomeAssistant instance."""
-        hass = MagicMock(spec=HomeAssistant)
-        hass.data = {DOMAIN: {}}
-        return hass
+    def mock_hass(self) -> SimpleNamespace:
+        """Create a stub HomeAssistant instance."""
+        return SimpleNamespace(data={DOMAIN: {}})
 
     @pytest.fixture
-    def mock_entry(self) -> MagicMock:
-        """Create a mock ConfigEntry."""
-        entry = MagicMock(spec=ConfigEntry)
-        entry.entry_id = "test_entry_id"
-        entry.version = 1
-        entry.domain = DOMAIN
-        entry.title = "Test Address"
-        entry.data = MOCK_CONFIG_ENTRY_DATA.copy()
-        entry.options = {"update_interval": 12}
-        return entry
+    def mock_entry(self) -> SimpleNamespace:
+        """Create a stub ConfigEntry."""
+        return SimpleNamespace(
+            entry_id="test_entry_id",
+            version=1,
+            domain=DOMAIN,
+            title="Test Address",
+            data=MOCK_CONFIG_ENTRY_DATA.copy(),
+            options={"update_interval": 12},
+        )
 
-    @pytest.fixture
-    def sample_data(self) -> RenovasjonData:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_data(cls) -> RenovasjonData:
         """Create sample RenovasjonData."""
         tomorrow = datetime.now() + timedelta(days=1)
 
@@ -61,7 +59,7 @@ class TestDiagnostics:
 
     @pytest.fixture
     def mock_coordinator(
-        self, mock_hass: MagicMock, mock_entry: MagicMock, sample_data: RenovasjonData
+        self, mock_hass: SimpleNamespace, mock_entry: SimpleNamespace, sample_data: RenovasjonData
     ) -> MagicMock:
         """Create a mock coordinator."""
         coordinator = MagicMock(spec=RenovasjonCoordinator)
@@ -75,8 +73,8 @@ class TestDiagnostics:
     @pytest.mark.asyncio
     async def test_diagnostics_with_data(
         self,
-        mock_hass: MagicMock,
-        mock_entry: MagicMock,
+        mock_hass: SimpleNamespace,
+        mock_entry: SimpleNamespace,
         mock_coordinator: MagicMock,
     ):
         """Test diagnostics returns correct data structure."""
@@ -109,8 +107,8 @@ class TestDiagnostics:
     @pytest.mark.asyncio
     async def test_diagnostics_without_data(
         self,
-        mock_hass: MagicMock,
-        mock_entry: MagicMock,
+        mock_hass: SimpleNamespace,
+        mock_entry: SimpleNamespace,
         mock_coordinator: MagicMock,
     ):
         """Test diagnostics when coordinator has no data."""
@@ -129,8 +127,8 @@ class TestDiagnostics:
     @pytest.mark.asyncio
     async def test_diagnostics_with_exception(
         self,
-        mock_hass: MagicMock,
-        mock_entry: MagicMock,
+        mock_hass: SimpleNamespace,
+        mock_entry: SimpleNamespace,
         mock_coordinator: MagicMock,
     ):
         """Test diagnostics when coordinator has an exception."""
@@ -146,8 +144,8 @@ class TestDiagnostics:
     @pytest.mark.asyncio
     async def test_diagnostics_disposal_format(
         self,
-        mock_hass: MagicMock,
-        mock_entry: MagicMock,
+        mock_hass: SimpleNamespace,
+        mock_entry: SimpleNamespace,
         mock_coordinator: MagicMock,
     ):
         """Test that disposals are correctly formatted in diagnostics."""
@@ -8,11 +8,83 @@ import pytest
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
 
 from ..const import DOMAIN
 from .conftest import MOCK_CONFIG_ENTRY_DATA
 
 
+class TestAsyncSetup:
+    """Tests for async_setup."""
+
+    @pytest.fixture
+    def mock_hass(self) -> MagicMock:
+        """Create a mock HomeAssistant instance."""
+        hass = MagicMock(spec=HomeAssistant)
+        hass.data = {}
+        hass.services = MagicMock()
+        hass.services.async_register = MagicMock()
+        return hass
+
+    @pytest.mark.asyncio
+    async def test_async_setup_registers_service(self, mock_hass: MagicMock):
+        """Test that the refresh service is registered once at integration setup."""
+        from .. import SERVICE_REFRESH, async_setup
+
+        result = await async_setup(mock_hass, {})
+
+        assert result is True
+        assert mock_hass.data[DOMAIN] == {}
+        mock_hass.services.async_register.assert_called_once()
+        call_args = mock_hass.services.async_register.call_args
+        assert call_args[0][0] == DOMAIN
+        assert call_args[0][1] == SERVICE_REFRESH
+
+    @pytest.mark.asyncio
+    async def test_refresh_service_specific_entry(self, mock_hass: MagicMock):
+        """Test refreshing a single entry through the service."""
+        from .. import async_setup
+
+        await async_setup(mock_hass, {})
+        handler = mock_hass.services.async_register.call_args[0][2]
+
+        coordinator = MagicMock()
+        coordinator.async_refresh = AsyncMock()
+        mock_hass.data[DOMAIN]["test_entry_id"] = coordinator
+
+        await handler(MagicMock(data={"entry_id": "test_entry_id"}))
+
+        coordinator.async_refresh.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_service_all_entries(self, mock_hass: MagicMock):
+        """Test refreshing all entries through the service."""
+        from .. import async_setup
+
+        await async_setup(mock_hass, {})
+        handler = mock_hass.services.async_register.call_args[0][2]
+
+        coordinators = [MagicMock(async_refresh=AsyncMock()) for _ in range(3)]
+        for index, coordinator in enumerate(coordinators):
+            mock_hass.data[DOMAIN][f"entry_{index}"] = coordinator
+
+        await handler(MagicMock(data={}))
+
+        for coordinator in coordinators:
+            coordinator.async_refresh.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_service_unknown_entry(self, mock_hass: MagicMock):
+        """Test refreshing an unknown entry raises a validation error."""
+        from .. import async_setup
+
+        await async_setup(mock_hass, {})
+        handler = mock_hass.services.async_register.call_args[0][2]
+
+        with pytest.raises(ServiceValidationError):
+            await handler(MagicMock(data={"entry_id": "unknown"}))
+
+
 class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
@@ -23,9 +95,6 @@ class TestAsyncSetupEntry:
         hass.data = {}
         hass.config_entries = MagicMock()
         hass.config_entries.async_forward_entry_setups = AsyncMock()
-        hass.services = MagicMock()
-        hass.services.has_service.return_value = False
-        hass.services.async_register = MagicMock()
         return hass
 
     @pytest.fixture
@@ -45,7 +114,10 @@ class TestAsyncSetupEntry:
         """Test successful setup of config entry."""
         from .. import async_setup_entry
 
-        with patch("remidt_renovasjon.RenovasjonCoordinator") as mock_coordinator_class:
+        with (
+            patch("remidt_renovasjon.RenovasjonCoordinator") as mock_coordinator_class,
+            patch("remidt_renovasjon.async_track_time_change") as mock_track_time_change,
+        ):
             mock_coordinator = MagicMock()
             mock_coordinator_class.return_value = mock_coordinator
 
@@ -62,6 +134,33 @@ class TestAsyncSetupEntry:
             assert mock_entry in call_args[0]
             assert Platform.SENSOR in call_args[0][1]
 
+            # Verify the midnight rollover is tracked and cleaned up on unload
+            mock_track_time_change.assert_called_once_with(
+                mock_hass, mock_coordinator.async_handle_midnight, hour=0, minute=0, second=0
+            )
+            mock_entry.async_on_unload.assert_any_call(mock_track_time_change.return_value)
+
+    @pytest.mark.asyncio
+    async def test_async_setup_entry_removes_coordinator_on_unload(
+        self, mock_hass: MagicMock, mock_entry: MagicMock
+    ):
+        """Test that the coordinator is dropped by the entry's unload callback."""
+        from .. import async_setup_entry
+
+        with (
+            patch("remidt_renovasjon.RenovasjonCoordinator"),
+            patch("remidt_renovasjon.async_track_time_change"),
+        ):
+            await async_setup_entry(mock_hass, mock_entry)
+
+        assert mock_entry.entry_id in mock_hass.data[DOMAIN]
+
+        # Home Assistant runs the async_on_unload callbacks after a successful unload
+        for call in mock_entry.async_on_unload.call_args_list:
+            call[0][0]()
+
+        assert mock_entry.entry_id not in mock_hass.data[DOMAIN]
+
 
 class TestAsyncUnloadEntry:
     """Tests for async_unload_entry."""
@@ -95,7 +194,9 @@ class TestAsyncUnloadEntry:
         result = await async_unload_entry(mock_hass, mock_entry)
 
         assert result is True
-        assert mock_entry.entry_id not in mock_hass.data[DOMAIN]
+        mock_hass.config_entries.async_unload_platforms.assert_awaited_once()
+        # Services belong to the integration and outlive individual entries
+        mock_hass.services.async_remove.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_unload_entry_failure(self, mock_hass: MagicMock, mock_entry: MagicMock):
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from ..api import WasteDisposal
 from ..const import (
@@ -29,26 +29,26 @@ class TestRenovasjonSensor:
     """Tests for RenovasjonSensor."""
 
     @pytest.fixture
-    def mock_hass(self) -> MagicMock:
-        """Create a mock HomeAssistant instance."""
-        hass = MagicMock(spec=HomeAssistant)
-        hass.data = {}
-        return hass
+    def mock_hass(self) -> SimpleNamespace:
+        """Create a stub HomeAssistant instance."""
+        return SimpleNamespace(data={})
 
     @pytest.fixture
-    def mock_entry(self) -> MagicMock:
-        """Create a mock ConfigEntry."""
-        entry = MagicMock(spec=ConfigEntry)
-        entry.entry_id = "test_entry_id"
-        entry.data = MOCK_CONFIG_ENTRY_DATA.copy()
-        return entry
+    def mock_entry(self) -> SimpleNamespace:
+        """Create a stub ConfigEntry."""
+        return SimpleNamespace(
+            entry_id="test_entry_id",
+            data=MOCK_CONFIG_ENTRY_DATA.copy(),
+        )
 
-    @pytest.fixture
-    def sample_data(self) -> RenovasjonData:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_data(cls) -> RenovasjonData:
         """Create sample RenovasjonData."""
-        tomorrow = datetime.now() + timedelta(days=1)
-        next_week = datetime.now() + timedelta(days=7)
-        two_weeks = datetime.now() + timedelta(days=14)
+        now = datetime.now()
+        tomorrow = now + timedelta(days=1)
+        next_week = now + timedelta(days=7)
+        two_weeks = now + timedelta(days=14)
 
         return RenovasjonData(
             address_id="test-uuid",
@@ -57,23 +57,12 @@ class TestRenovasjonSensor:
             disposals_by_fraction={
                 "Restavfall": [
                     WasteDisposal(
-                        date=tomorrow,
-                        fraction="Restavfall",
-                        description=None,
-                        symbol_id=15,
-                    ),
-                    WasteDisposal(
-                        date=next_week,
-                        fraction="Restavfall",
-                        description=None,
-                        symbol_id=15,
-                    ),
-                    WasteDisposal(
-                        date=two_weeks,
+                        date=disposal_date,
                         fraction="Restavfall",
                         description=None,
                         symbol_id=15,
-                    ),
+                    )
+                    for disposal_date in (tomorrow, next_week, two_weeks)
                 ],
                 "Matavfall": [
                     WasteDisposal(
@@ -88,13 +77,15 @@ class TestRenovasjonSensor:
 
     @pytest.fixture
     def mock_coordinator(
-        self, mock_hass: MagicMock, mock_entry: MagicMock, sample_data: RenovasjonData
+        self, mock_hass: SimpleNamespace, mock_entry: SimpleNamespace, sample_data: RenovasjonData
     ) -> MagicMock:
         """Create a mock coordinator."""
         coordinator = MagicMock(spec=RenovasjonCoordinator)
         coordinator.hass = mock_hass
         coordinator.config_entry = mock_entry
+        coordinator.device_info = DeviceInfo(identifiers={(DOMAIN, mock_entry.entry_id)})
         coordinator.data = sample_data
+        coordinator.last_update_success = True
         return coordinator
 
     @pytest.fixture
@@ -159,15 +150,37 @@ class TestRenovasjonSensor:
         assert ATTR_ADDRESS not in attrs
         assert ATTR_DAYS_UNTIL not in attrs
 
-    def test_sensor_device_info(self, sensor: RenovasjonSensor):
-        """Test sensor device info."""
-        device_info = sensor._attr_device_info
+    def test_sensor_device_info(self, sensor: RenovasjonSensor, mock_coordinator: MagicMock):
+        """Test sensor shares the coordinator's device info."""
+        assert sensor._attr_device_info is mock_coordinator.device_info
+
+    def test_coordinator_update_skips_unchanged_state(
+        self, sensor: RenovasjonSensor, mock_coordinator: MagicMock, sample_data: RenovasjonData
+    ):
+        """Test state is only written when the schedule or the day changes."""
+        # Work on a private copy, the class-scoped sample data is shared
+        data = RenovasjonData(
+            address_id=sample_data.address_id,
+            address_name=sample_data.address_name,
+            municipality=sample_data.municipality,
+            disposals_by_fraction=sample_data.disposals_by_fraction,
+        )
+        mock_coordinator.data = data
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 1
 
-        assert device_info is not None
-        assert ("remidt_renovasjon", "test_entry_id") in device_info["identifiers"]
-        assert "Renovasjon Test Street 1" in device_info["name"]
-        assert device_info["manufacturer"] == "Renovasjonsportal"
-        assert device_info["model"] == "Test Municipality"
+        # Schedule for this fraction changed
+        data.fraction_version["Restavfall"] += 1
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 2
+
+        # Midnight rollover
+        data.update_today(data.today + timedelta(days=1))
+        sensor._handle_coordinator_update()
+        assert sensor.async_write_ha_state.call_count == 3
 
     def test_sensor_for_unknown_fraction(self, mock_coordinator: MagicMock):
         """Test sensor for a fraction not in WASTE_FRACTIONS."""
@@ -195,23 +208,21 @@ class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
     @pytest.fixture
-    def mock_hass(self) -> MagicMock:
-        """Create a mock HomeAssistant instance."""
-        hass = MagicMock(spec=HomeAssistant)
-        hass.data = {DOMAIN: {}}
-        return hass
+    def mock_hass(self) -> SimpleNamespace:
+        """Create a stub HomeAssistant instance."""
+        return SimpleNamespace(data={DOMAIN: {}})
 
     @pytest.fixture
-    def mock_entry(self) -> MagicMock:
-        """Create a mock ConfigEntry."""
-        entry = MagicMock(spec=ConfigEntry)
-        entry.entry_id = "test_entry_id"
-        entry.data = MOCK_CONFIG_ENTRY_DATA.copy()
-        return entry
+    def mock_entry(self) -> SimpleNamespace:
+        """Create a stub ConfigEntry."""
+        return SimpleNamespace(
+            entry_id="test_entry_id",
+            data=MOCK_CONFIG_ENTRY_DATA.copy(),
+        )
 
     @pytest.mark.asyncio
     async def test_async_setup_entry_creates_sensors(
-        self, mock_hass: MagicMock, mock_entry: MagicMock
+        self, mock_hass: SimpleNamespace, mock_entry: SimpleNamespace
     ):
         """Test that async_setup_entry creates sensors for each fraction."""
         from ..sensor import async_setup_entry
@@ -230,6 +241,7 @@ class TestAsyncSetupEntry:
         mock_coordinator = MagicMock(spec=RenovasjonCoordinator)
         mock_coordinator.data = sample_data
         mock_coordinator.config_entry = mock_entry
+        mock_coordinator.device_info = DeviceInfo(identifiers={(DOMAIN, mock_entry.entry_id)})
         mock_coordinator.async_config_entry_first_refresh = AsyncMock()
 
         mock_hass.data[DOMAIN][mock_entry.entry_id] = mock_coordinator